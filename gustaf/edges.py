@@ -80,6 +80,26 @@ class Edges(Vertices):
     __show_option__ = EdgesShowOption
     __boundary_class__ = Vertices
 
+    # naming rule in gustaf - connectivity is named after the class
+    _elem_name = "edges"
+    _const_elem_name = "const_edges"
+
+    def __init_subclass__(cls, *args, **kwargs):
+        """Sets connectivity names of subclasses once.
+
+        Parameters
+        -----------
+        *args: Any
+        **kwargs: Any
+
+        Returns
+        --------
+        None
+        """
+        super().__init_subclass__(*args, **kwargs)
+        cls._elem_name = cls.__qualname__.lower()
+        cls._const_elem_name = "const_" + cls._elem_name
+
     def __init__(
         self,
         vertices=None,
@@ -137,7 +157,7 @@ class Edges(Vertices):
 
         # shape check
         if es is not None:
-            utils.arr.is_shape(es, (-1, 2), strict=True)
+            utils.arr.is_shape(self._edges, (-1, 2), strict=True)
 
         # same, but non-writeable view of tracked array
         self._const_edges = self._edges.view()
@@ -181,11 +201,50 @@ class Edges(Vertices):
 
         Returns
         --------
-        edges_sorted: (n_edges, 2) np.ndarray
+        sorted_edges: (n_edges, 2) np.ndarray
+        """
+        edges = self._get_attr("edges")
+
+        # for two columns, min / max is cheaper than sort along axis=1
+        sorted_edges = np.empty(edges.shape, dtype=edges.dtype)
+        np.minimum(edges[:, 0], edges[:, 1], out=sorted_edges[:, 0])
+        np.maximum(edges[:, 0], edges[:, 1], out=sorted_edges[:, 1])
+
+        return sorted_edges
+
+    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    def edge_endpoints(self):
+        """Returns vertices of both ends of each edge, gathered at once.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        edge_endpoints: (n_edges, 2, d) np.ndarray
         """
         edges = self._get_attr("edges")
 
-        return np.sort(edges, axis=1)
+        return np.asarray(self.const_vertices)[edges]
+
+    @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
+    def edge_lengths(self):
+        """Returns length of each edge.
+
+        Parameters
+        -----------
+        None
+
+        Returns
+        --------
+        edge_lengths: (n_edges,) np.ndarray
+        """
+        endpoints = self.edge_endpoints()
+        diff = endpoints[:, 1] - endpoints[:, 0]
+
+        # einsum squares and sums without a temporary for diff**2
+        return np.sqrt(np.einsum("ij,ij->i", diff, diff))
 
     @helpers.data.ComputedMeshData.depends_on(["elements"])
     def unique_edges(self):
@@ -227,7 +286,7 @@ class Edges(Vertices):
         """
         unique_info = self.unique_edges()
 
-        return unique_info.ids[unique_info.counts == 1]
+        return unique_info.ids[np.flatnonzero(unique_info.counts == 1)]
 
     @property
     def elements(self):
@@ -244,10 +303,10 @@ class Edges(Vertices):
         elements: (n, d) np.ndarray
           int. iff elements=None
         """
-        elem_name = type(self).__qualname__.lower()
-        self._logd(f"returning {elem_name}")
+        if utils.log.debug_enabled():
+            self._logd(f"returning {self._elem_name}")
 
-        return getattr(self, elem_name)
+        return getattr(self, self._elem_name)
 
     @elements.setter
     def elements(self, elements):
@@ -263,10 +322,10 @@ class Edges(Vertices):
         --------
         None
         """
-        # naming rule in gustaf
-        elem_name = type(self).__qualname__.lower()
-        self._logd(f"Setting {elem_name}'s connectivity.")
-        return setattr(self, elem_name, elements)
+        if utils.log.debug_enabled():
+            self._logd(f"Setting {self._elem_name}'s connectivity.")
+
+        return setattr(self, self._elem_name, elements)
 
     @property
     def const_elements(self):
@@ -281,7 +340,7 @@ class Edges(Vertices):
         non_mutable_elements: (n, d) TrackedArray
         """
         self._logd("returning const_elements")
-        return getattr(self, "const_" + type(self).__qualname__.lower())
+        return getattr(self, self._const_elem_name)
 
     @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
     def centers(self):
@@ -297,7 +356,21 @@ class Edges(Vertices):
         """
         self._logd("computing centers")
 
-        return self.const_vertices[self.const_elements].mean(axis=1)
+        vertices = self.const_vertices
+        elements = self.const_elements
+
+        # accumulate one node per element at a time, instead of
+        # gathering (n_elements, nodes_per_element, d) array.
+        # start from the first node to skip zero filling.
+        centers = np.take(np.asarray(vertices), elements[:, 0], axis=0)
+        tmp = np.empty_like(centers)
+        for node_ids in elements.T[1:]:
+            np.take(vertices, node_ids, axis=0, out=tmp)
+            centers += tmp
+
+        centers *= 1.0 / elements.shape[1]
+
+        return centers
 
     @helpers.data.ComputedMeshData.depends_on(["vertices", "elements"])
     def referenced_vertices(
@@ -330,10 +403,22 @@ class Edges(Vertices):
         --------
         new_self: type(self)
         """
-        referenced = self.referenced_vertices()
+        referenced = utils.arr.unique_int_1d(self.const_elements)
+
+        n_vertices = len(self.const_vertices)
+        if len(referenced) == n_vertices:
+            return self
 
-        inverse = np.zeros(len(self.vertices), dtype=settings.INT_DTYPE)
-        inverse[referenced] = np.arange(referenced.sum())
+        # empty int mask means "keep all" for update_vertices.
+        # nothing is referenced, so remove all with a bool mask.
+        if len(referenced) == 0:
+            return self.update_vertices(mask=np.zeros(n_vertices, dtype=bool))
+
+        # only referenced entries are looked up, so no need to initialize
+        inverse = np.empty(n_vertices, dtype=settings.INT_DTYPE)
+        inverse[referenced] = np.arange(
+            len(referenced), dtype=settings.INT_DTYPE
+        )
 
         return self.update_vertices(
             mask=referenced,
@@ -387,25 +472,32 @@ class Edges(Vertices):
             # apply "automatic" spacing
             spacing = self.bounds_diagonal_norm() / 50
 
-        v0s = self.vertices[self.edges[:, 0]]
-        v1s = self.vertices[self.edges[:, 1]]
+        endpoints = self.edge_endpoints()
+        v0s = endpoints[:, 0]
+        v1s = endpoints[:, 1]
 
-        distances = np.linalg.norm(v0s - v1s, axis=1)
+        distances = self.edge_lengths()
         linspaces = (((distances // (spacing * 1.5)) + 1) * 3).astype(np.int32)
 
-        # chop vertices!
-        new_vs = []
-        for v0, v1, lins in zip(v0s, v1s, linspaces):
-            new_vs.append(np.linspace(v0, v1, lins))
+        # chop vertices! same as calling np.linspace(v0, v1, lins) for each
+        # edge, but all at once. mid points of each dash (1::3) aren't
+        # required, so only 2 of every 3 points are created.
+        # local_ids are ids within each edge: 0, 2, 3, 5, 6, ...
+        n_points = (linspaces // 3) * 2
+        offsets = np.concatenate(([0], n_points.cumsum()))
+        local_ids = np.arange(offsets[-1]) - np.repeat(offsets[:-1], n_points)
+        local_ids = (local_ids // 2) * 3 + (local_ids % 2) * 2
+        # interpolate in vertices' precision - settings.FLOAT_DTYPE
+        t = np.divide(
+            local_ids,
+            np.repeat(linspaces - 1, n_points),
+            dtype=settings.FLOAT_DTYPE,
+        )
+        edge_ids = np.repeat(np.arange(len(linspaces)), n_points)
 
-        # we need all chopped vertices.
         # there might be duplicating vertices. you can use merge_vertices
-        new_vs = np.vstack(new_vs)
-        # all mid points are explicitly defined, but they aren't required
-        # so, rm.
-        mask = np.ones(len(new_vs), dtype=bool)
-        mask[1::3] = False
-        new_vs = new_vs[mask]
+        v0s = v0s[edge_ids]
+        new_vs = v0s + t.reshape(-1, 1) * (v1s[edge_ids] - v0s)
 
         # prepare edges
         tmp_es = utils.connec.range_to_edges((0, len(new_vs)), closed=False)
@@ -429,17 +521,18 @@ class Edges(Vertices):
           shrunk elements
         """
         elements = self.const_elements
-        vs = np.vstack(self.vertices[elements])
-        es = np.arange(len(vs))
 
-        nodes_per_element = elements.shape[1]
-        es = es.reshape(-1, nodes_per_element)
+        # (n_elements, nodes_per_element, d). gather from plain ndarray,
+        # so that inplace operations below won't mark vertices modified.
+        vs = np.asarray(self.const_vertices)[elements]
 
-        mids = np.repeat(self.centers(), nodes_per_element, axis=0)
-
-        vs -= mids
+        # mid + ratio * (v - mid) == ratio * v + (1 - ratio) * mid.
+        # mids are broadcasted per element, instead of repeated per vertex
         vs *= ratio
-        vs += mids
+        vs += (1 - ratio) * self.centers()[:, np.newaxis]
+
+        vs = vs.reshape(-1, vs.shape[2])
+        es = np.arange(len(vs)).reshape(-1, elements.shape[1])
 
         s_elements = type(self)(vertices=vs, elements=es)
 
@@ -214,7 +214,7 @@ class Faces(Edges):
         # shape check
         if fs is not None:
             utils.arr.is_one_of_shapes(
-                fs,
+                self._faces,
                 ((-1, 3), (-1, 4)),
                 strict=True,
             )
@@ -239,7 +239,7 @@ class Faces(Edges):
 
     @helpers.data.ComputedMeshData.depends_on(["elements"])
     def sorted_faces(self):
-        """Similar to edges_sorted but for faces.
+        """Similar to sorted_edges but for faces.
 
         Parameters
         -----------
@@ -291,7 +291,7 @@ class Faces(Edges):
         """
         unique_info = self.unique_faces()
 
-        return unique_info.ids[unique_info.counts == 1]
+        return unique_info.ids[np.flatnonzero(unique_info.counts == 1)]
 
     def update_faces(self, *args, **kwargs):
         """Alias to update_elements."""
@@ -170,7 +170,13 @@ def make_tracked_array(array, dtype=None, copy=True):
         array = []
     # make sure it is contiguous then view it as our subclass
     tracked = np.ascontiguousarray(array, dtype=dtype)
-    if copy:
+    # copy only if tracked may still refer to given array's memory.
+    # conversions from list / tuple are always a copy. anything else, such
+    # as objects with __array__, may hand back memory they still own.
+    if copy and (
+        not isinstance(array, (list, tuple))
+        and np.may_share_memory(tracked, np.asanyarray(array))
+    ):
         tracked = tracked.copy().view(TrackedArray)
     else:
         tracked = tracked.view(TrackedArray)
@@ -391,6 +397,11 @@ class ComputedData(DataHolder):
                 computed = func(*args, **kwargs)
                 if isinstance(computed, np.ndarray):
                     computed.flags.writeable = False  # configurable?
+                elif isinstance(computed, tuple):
+                    # e.g. Unique2DIntegers - shared by all the callers
+                    for c in computed:
+                        if isinstance(c, np.ndarray):
+                            c.flags.writeable = False
                 self._computed._saved[func.__name__] = computed
 
                 # so, all fresh. we can press NOT-modified  button
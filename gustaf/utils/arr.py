@@ -126,7 +126,11 @@ def unique_rows(
     if len(in_arr.shape) != 2:
         raise ValueError("unique_rows can be only applied for 2D arrays")
 
-    in_arr_row_view = in_arr.view(f"|S{in_arr.itemsize * in_arr.shape[1]}")
+    # view each row as a single scalar, so that np.unique sorts 1D keys.
+    # flat view also keeps inverse 1D.
+    in_arr_row_view = in_arr.view(
+        f"|S{in_arr.itemsize * in_arr.shape[1]}"
+    ).reshape(-1)
 
     unique_stuff = np.unique(
         in_arr_row_view,
@@ -145,6 +149,53 @@ def unique_rows(
     return unique_stuff
 
 
+def unique_int_1d(in_arr):
+    """Sorted unique values of an integer array. Unlike np.unique, tries to
+    avoid sorting: already sorted input is filtered in a single pass and
+    input with a compact value range (e.g. vertex ids of connectivity) is
+    marked in a boolean array.
+
+    Parameters
+    -----------
+    in_arr: array-like
+      integers. Will be flattened.
+
+    Returns
+    --------
+    unique_arr: (n,) np.ndarray
+    """
+    in_arr = np.asarray(in_arr).ravel()
+
+    if len(in_arr) < 2:
+        return in_arr.copy()
+
+    # sorted - keep first of each run.
+    # check a strided sample first to avoid full comparison of unsorted ones
+    sample = in_arr[:: max(len(in_arr) // 1024, 1)]
+    if (sample[1:] >= sample[:-1]).all() and (in_arr[1:] >= in_arr[:-1]).all():
+        keep = np.empty(len(in_arr), dtype=bool)
+        keep[0] = True
+        np.not_equal(in_arr[1:], in_arr[:-1], out=keep[1:])
+
+        return in_arr[keep]
+
+    # compact range - mark and collect
+    min_value = in_arr.min()
+    value_range = int(in_arr.max()) - int(min_value) + 1
+    if value_range <= 2 * len(in_arr):
+        marked = np.zeros(value_range, dtype=bool)
+        if min_value == 0:
+            marked[in_arr] = True
+            unique_arr = np.flatnonzero(marked)
+        else:
+            marked[in_arr - min_value] = True
+            unique_arr = np.flatnonzero(marked) + min_value
+
+        return unique_arr.astype(in_arr.dtype, copy=False)
+
+    return np.unique(in_arr)
+
+
 def close_rows(
     arr, tolerance=None, return_intersection=False, nthreads=None, **kwargs
 ):
@@ -296,7 +296,7 @@ def make_quad_faces(resolutions):
     except ValueError as e:
         raise ValueError(f"Problem with generating node indices. {e}")
 
-    faces = np.ones((total_faces, 4)) * -1
+    faces = np.full((total_faces, 4), -1, dtype=np.int32)
 
     faces[:, 0] = node_indices[: (nnpd[1] - 1), : (nnpd[0] - 1)].ravel()
     faces[:, 1] = node_indices[: (nnpd[1] - 1), 1 : nnpd[0]].ravel()
@@ -306,7 +306,7 @@ def make_quad_faces(resolutions):
     if faces.all() == -1:
         raise ValueError("Something went wrong during `make_quad_faces`.")
 
-    return faces.astype(np.int32)
+    return faces
 
 
 def make_hexa_volumes(resolutions):
@@ -341,7 +341,7 @@ def make_hexa_volumes(resolutions):
     total_volumes = np.prod(nnpd - 1)
     node_indices = np.arange(total_nodes, dtype=np.int32).reshape(nnpd[::-1])
 
-    volumes = np.ones((total_volumes, 8), dtype=np.int32) * int(-1)
+    volumes = np.full((total_volumes, 8), -1, dtype=np.int32)
 
     volumes[:, 0] = node_indices[
         : (nnpd[2] - 1), : (nnpd[1] - 1), : (nnpd[0] - 1)
@@ -369,7 +369,7 @@ def make_hexa_volumes(resolutions):
     if (volumes == -1).any():
         raise ValueError("Something went wrong during `make_hexa_volumes`.")
 
-    return volumes.astype(settings.INT_DTYPE)
+    return volumes.astype(settings.INT_DTYPE, copy=False)
 
 
 def subdivide_edges(edges):
@@ -563,13 +563,27 @@ def sorted_unique(connectivity, sorted_=False):
     """
     s_connec = connectivity if sorted_ else np.sort(connectivity, axis=1)
 
-    unique_stuff = arr.unique_rows(
-        s_connec,
-        return_index=True,
-        return_inverse=True,
-        return_counts=True,
-        dtype_name=settings.INT_DTYPE,
-    )
+    # if each row of non-negative ids fits into 64 bits, pack them into
+    # a single uint64. unique of 1D integer keys is cheaper than unique of
+    # rows. e.g. edges with ids < 2^32, triangles with ids < 2^21.
+    packable = False
+    if s_connec.ndim == 2 and s_connec.size > 0 and s_connec.min() >= 0:
+        n_bits = int(s_connec.max()).bit_length()
+        packable = n_bits * s_connec.shape[1] <= 64
+
+    if packable:
+        s_connec = arr.make_c_contiguous(s_connec, settings.INT_DTYPE)
+        unique_stuff = [None, *_unique_keys(_pack_rows(s_connec, n_bits))]
+        unique_stuff[0] = s_connec[unique_stuff[1]]
+
+    else:
+        unique_stuff = arr.unique_rows(
+            s_connec,
+            return_index=True,
+            return_inverse=True,
+            return_counts=True,
+            dtype_name=settings.INT_DTYPE,
+        )
 
     return helpers.data.Unique2DIntegers(
         unique_stuff[0],  # values
@@ -577,3 +591,61 @@ def sorted_unique(connectivity, sorted_=False):
         unique_stuff[2],  # inverse
         unique_stuff[3],  # counts
     )
+
+
+def _pack_rows(rows, n_bits):
+    """Packs (n, m) array of non-negative integers into (n,) uint64 keys,
+    using n_bits per column. Ordering of keys is the same as lexicographic
+    ordering of rows.
+
+    Parameters
+    -----------
+    rows: (n, m) np.ndarray
+    n_bits: int
+      m * n_bits should not exceed 64.
+
+    Returns
+    --------
+    keys: (n,) np.ndarray
+      uint64
+    """
+    keys = rows[:, 0].astype(np.uint64)
+    for i in range(1, rows.shape[1]):
+        keys <<= np.uint64(n_bits)
+        keys |= rows[:, i].astype(np.uint64)
+
+    return keys
+
+
+def _unique_keys(keys):
+    """Same as np.unique(keys, return_index=True, return_inverse=True,
+    return_counts=True), without values. Instead of stable sort, it uses
+    default sort and takes the smallest index of each unique key, which
+    is the same as first occurrence.
+
+    Parameters
+    -----------
+    keys: (n,) np.ndarray
+      n > 0
+
+    Returns
+    --------
+    ids: (m,) np.ndarray
+    inverse: (n,) np.ndarray
+    counts: (m,) np.ndarray
+    """
+    order = np.argsort(keys)
+    sorted_keys = keys[order]
+
+    # marks start of each unique key
+    is_first = np.empty(len(keys), dtype=bool)
+    is_first[0] = True
+    np.not_equal(sorted_keys[1:], sorted_keys[:-1], out=is_first[1:])
+    first = np.flatnonzero(is_first)
+
+    ids = np.minimum.reduceat(order, first)
+    counts = np.diff(first, append=len(keys))
+    inverse = np.empty(len(keys), dtype=first.dtype)
+    inverse[order] = np.cumsum(is_first) - 1
+
+    return ids, inverse, counts
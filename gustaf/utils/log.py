@@ -56,6 +56,21 @@ def configure(debug=False, logfile=None):
         logger.addHandler(file_logger_handler)
 
 
+def debug_enabled():
+    """Returns True if debug logs will be printed. Useful to skip building
+    debug messages.
+
+    Parameters
+    -----------
+    None
+
+    Returns
+    --------
+    enabled: bool
+    """
+    return logging.getLogger("gustaf").isEnabledFor(logging.DEBUG)
+
+
 def debug(*log):
     """Debug logger.
 
@@ -67,8 +82,9 @@ def debug(*log):
     --------
     None
     """
-    logger = logging.getLogger("gustaf")
-    logger.debug(" ".join(map(str, log)))
+    # skip string building if it won't be logged
+    if debug_enabled():
+        logging.getLogger("gustaf").debug(" ".join(map(str, log)))
 
 
 def info(*log):
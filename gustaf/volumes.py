@@ -196,7 +196,7 @@ class Volumes(Faces):
         )
         if vols is not None:
             utils.arr.is_one_of_shapes(
-                vols,
+                self._volumes,
                 ((-1, 4), (-1, 8)),
                 strict=True,
             )
@@ -228,7 +228,7 @@ class Volumes(Faces):
 
         Returns
         --------
-        volumes_sorted: (volumes.shape) np.ndarray
+        sorted_volumes: (volumes.shape) np.ndarray
         """
         volumes = self._get_attr("volumes")
 
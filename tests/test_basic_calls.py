@@ -42,6 +42,8 @@ class BasicCallsTest(unittest.TestCase):
         es.const_edges
         es.whatami
         es.sorted_edges()
+        es.edge_endpoints()
+        es.edge_lengths()
         es.unique_edges()
         es.single_edges()
         es.elements = es.elements
@@ -68,6 +70,8 @@ class BasicCallsTest(unittest.TestCase):
             fs.single_faces()
 
             fs.sorted_edges()
+            fs.edge_endpoints()
+            fs.edge_lengths()
             fs.unique_edges()
             fs.single_edges()
             fs.centers()
@@ -90,6 +94,8 @@ class BasicCallsTest(unittest.TestCase):
             vs.to_faces()
 
             vs.sorted_edges()
+            vs.edge_endpoints()
+            vs.edge_lengths()
             vs.unique_edges()
             vs.single_edges()
             vs.centers()
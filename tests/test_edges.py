@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+import gustaf as gus
+
+
+def dashed_reference(edges, spacing):
+    """linspace each edge and drop mid point of each dash."""
+    if spacing is None:
+        spacing = edges.bounds_diagonal_norm() / 50
+
+    v0s = edges.vertices[edges.edges[:, 0]]
+    v1s = edges.vertices[edges.edges[:, 1]]
+    distances = np.linalg.norm(v0s - v1s, axis=1)
+    linspaces = (((distances // (spacing * 1.5)) + 1) * 3).astype(np.int32)
+
+    new_vs = np.vstack(
+        [
+            np.linspace(v0, v1, lins)
+            for v0, v1, lins in zip(v0s, v1s, linspaces)
+        ]
+    )
+    mask = np.ones(len(new_vs), dtype=bool)
+    mask[1::3] = False
+    new_vs = new_vs[mask]
+
+    tmp_es = gus.utils.connec.range_to_edges((0, len(new_vs)), closed=False)
+    new_es = tmp_es[::2]
+
+    return new_vs, new_es
+
+
+@pytest.fixture
+def random_edges():
+    vertices = np.random.random((50, 3))
+    edges = np.random.randint(0, 50, (100, 2))
+    # zero-length edge
+    edges[0] = [3, 3]
+
+    return gus.Edges(vertices, edges)
+
+
+@pytest.mark.parametrize("grid", ("edges", "random_edges"))
+@pytest.mark.parametrize("spacing", (None, 0.01, 0.1, 0.3, 10.0))
+def test_dashed(grid, spacing, request):
+    """dashed should match linspace-then-drop-mid-points"""
+    grid = request.getfixturevalue(grid)
+
+    dashed = grid.dashed(spacing)
+    vertices_ref, edges_ref = dashed_reference(grid, spacing)
+
+    assert dashed.vertices.shape == vertices_ref.shape
+    assert np.allclose(dashed.vertices, vertices_ref)
+    assert np.array_equal(dashed.edges, edges_ref)
+
+
+@pytest.mark.parametrize("grid", ("edges", "faces_tri", "volumes_hexa"))
+def test_edge_endpoints_and_lengths(grid, request):
+    """edge_lengths should follow vertex updates"""
+    grid = request.getfixturevalue(grid)
+
+    def check():
+        es = grid._get_attr("edges")
+        vs = grid.vertices
+
+        endpoints = grid.edge_endpoints()
+        assert endpoints.shape == (len(es), 2, vs.shape[1])
+        assert np.allclose(endpoints[:, 0], vs[es[:, 0]])
+        assert np.allclose(endpoints[:, 1], vs[es[:, 1]])
+
+        assert np.allclose(
+            grid.edge_lengths(),
+            np.linalg.norm(vs[es[:, 0]] - vs[es[:, 1]], axis=1),
+        )
+
+    check()
+
+    # inplace edit should invalidate cached values
+    grid.vertices[0] += 1.0
+    check()
+
+
+@pytest.mark.parametrize("grid", ("edges", "faces_tri", "volumes_hexa"))
+def test_unique_info_cached_and_read_only(grid, request):
+    """cached namedtuple results are shared, so they shouldn't be writeable"""
+    grid = request.getfixturevalue(grid)
+
+    unique_edges = grid.unique_edges()
+    assert grid.unique_edges() is unique_edges
+    for array in unique_edges:
+        assert not array.flags.writeable
+
+    with pytest.raises(ValueError):
+        unique_edges.inverse[0] = 0
+
+    unique_vertices = grid.unique_vertices()
+    assert grid.unique_vertices() is unique_vertices
+    for array in unique_vertices[:3]:
+        assert not array.flags.writeable
@@ -1,6 +1,7 @@
 import numpy as np
+import pytest
 
-from gustaf.utils.arr import make_c_contiguous
+from gustaf.utils.arr import make_c_contiguous, unique_int_1d, unique_rows
 
 
 def test_make_c_contiguous_forNoneValues():
@@ -49,3 +50,33 @@ def test_make_c_contiguous_nonContiguousArray(sample_c_contiguous_non_con):
     assert make_c_contiguous(
         sample_c_contiguous_non_con, int
     ).flags.c_contiguous
+
+
+def test_unique_rows():
+    arr = np.array([[1, 2], [0, 3], [1, 2], [2, 1], [0, 3], [1, 2]])
+    values, ids, inverse, counts = unique_rows(arr)
+
+    # row order may differ, but each unique row appears once
+    assert len(values) == 3
+    assert np.equal(values, arr[ids]).all()
+    # inverse should be 1D and map back to original
+    assert inverse.shape == (len(arr),)
+    assert np.equal(values[inverse], arr).all()
+    assert counts.sum() == len(arr)
+
+
+@pytest.mark.parametrize(
+    "arr",
+    (
+        [],
+        [3],
+        [0, 0, 1, 4, 4, 7],  # sorted
+        [[5, 1, 1], [2, 5, 0]],  # compact range
+        [10**9, 1, 10**9, -5],  # sparse range
+    ),
+)
+def test_unique_int_1d(arr):
+    unique_arr = unique_int_1d(np.asarray(arr, dtype=np.int32))
+
+    assert np.equal(unique_arr, np.unique(arr)).all()
+    assert unique_arr.dtype == np.int32
@@ -6,6 +6,7 @@ from gustaf.utils.connec import (
     hexa_to_quad,
     make_hexa_volumes,
     make_quad_faces,
+    sorted_unique,
     tet_to_tri,
 )
 
@@ -79,3 +80,24 @@ def test_make_hexa_volumes_throwException(sample_hex_fail):
 
 def test_make_hexa_volumes_suc(sample_hex, expected_hexa_volumes):
     assert np.equal(expected_hexa_volumes, make_hexa_volumes(sample_hex)).all()
+
+
+@pytest.mark.parametrize("n_columns", (2, 3, 8))
+@pytest.mark.parametrize("max_id", (10, 2**31 - 1))
+def test_sorted_unique(n_columns, max_id):
+    connec = np.random.randint(0, max_id, (100, n_columns))
+    # repeat first half
+    connec[50:] = connec[:50]
+    # append flipped duplicates
+    connec = np.vstack((connec, connec[:, ::-1]))
+    s_connec = np.sort(connec, axis=1)
+
+    unique_info = sorted_unique(connec)
+
+    assert np.equal(unique_info.values, s_connec[unique_info.ids]).all()
+    assert np.equal(unique_info.values[unique_info.inverse], s_connec).all()
+    assert len(np.unique(unique_info.values, axis=0)) == len(
+        unique_info.values
+    )
+    assert unique_info.counts.sum() == len(connec)
+    assert (unique_info.counts >= 2).all()
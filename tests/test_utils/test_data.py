@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from gustaf import settings
+from gustaf.helpers.data import TrackedArray, make_tracked_array
+
+
+def matching_array():
+    return np.arange(12, dtype=settings.INT_DTYPE).reshape(-1, 2)
+
+
+def contiguous_slice():
+    return np.arange(24, dtype=settings.INT_DTYPE).reshape(-1, 2)[3:9]
+
+
+def non_contiguous_view():
+    return np.arange(24, dtype=settings.INT_DTYPE).reshape(-1, 4)[:, ::2]
+
+
+def list_input():
+    return [[0, 1], [2, 3], [4, 5]]
+
+
+def tracked_array():
+    return make_tracked_array(matching_array(), settings.INT_DTYPE, False)
+
+
+class ArrayLike:
+    """Hands back an array it owns."""
+
+    def __init__(self):
+        self.a = matching_array().copy()
+        assert self.a.base is None
+
+    def __array__(self, dtype=None, copy=None):
+        return self.a
+
+
+def array_like():
+    return ArrayLike()
+
+
+@pytest.mark.parametrize(
+    "make_input",
+    (
+        matching_array,
+        contiguous_slice,
+        non_contiguous_view,
+        list_input,
+        tracked_array,
+        array_like,
+    ),
+)
+def test_make_tracked_array_copy(make_input):
+    array = make_input()
+    tracked = make_tracked_array(array, settings.INT_DTYPE, True)
+
+    assert isinstance(tracked, TrackedArray)
+    assert tracked.flags.c_contiguous
+    if isinstance(array, ArrayLike):
+        array = array.a
+    assert np.array_equal(tracked, array)
+    if isinstance(array, np.ndarray):
+        assert not np.shares_memory(array, tracked)
+
+
+def test_make_tracked_array_no_copy():
+    array = matching_array()
+    tracked = make_tracked_array(array, settings.INT_DTYPE, False)
+
+    assert np.shares_memory(array, tracked)
@@ -246,3 +246,14 @@ def test_update_elements(grid, request):
         test_grid.vertices[leftover_vertex_ids],
         grid.vertices[leftover_vertex_ids_ref],
     )
+
+
+@pytest.mark.parametrize("grid", update_elements_params)
+def test_update_elements_remove_all(grid, request):
+    """all-False mask should remove all elements and vertices"""
+    grid = request.getfixturevalue(grid)
+
+    grid.update_elements(np.zeros(len(grid.elements), dtype=bool))
+
+    assert len(grid.elements) == 0
+    assert len(grid.vertices) == 0